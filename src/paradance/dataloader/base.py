@@ -19,6 +19,16 @@ class BaseDataLoaderConfig(BaseModel):
         file_sep (Optional[str]): The sep of the csv. Defaults to ',' you can use '\t'.
         max_rows (Optional[int]): The maximum number of rows to load from the file.
                                   Defaults to None, indicating no limit.
+        engine (Optional[str]): The CSV parsing backend, one of 'pandas', 'pyarrow' or 'polars'.
+                                Defaults to 'pandas'. Falls back to pandas if the backend is not installed.
+        chunksize (Optional[int]): Number of rows per chunk when reading CSV files with pandas. Rows
+                                   dropped by `clean_zero_columns` are removed chunk by chunk to cap
+                                   peak memory. Defaults to None, which reads each file at once.
+        usecols (Optional[List[str]]): Columns to read from CSV files, matched against the names left after
+                                       splitting off the '.' prefix. Defaults to None, which reads every column.
+        excel_parquet_cache (bool): Whether excel files are also saved as `<stem>.paradance.parquet` next to
+                                    the workbook and read from that copy while it is newer. Defaults to False.
+                                    Pipelines can use the keyed DataLoader `cache` instead.
     """
 
     file_path: Optional[str] = None
@@ -28,6 +38,10 @@ class BaseDataLoaderConfig(BaseModel):
     max_rows: Optional[int] = None
     clean_zero_columns: Optional[Union[bool, List]] = None
     clean_gauc_lab_columns: Optional[Union[bool, dict]] = None
+    engine: Optional[str] = "pandas"
+    chunksize: Optional[int] = None
+    usecols: Optional[List[str]] = None
+    excel_parquet_cache: bool = False
 
 
 class BaseDataLoader(ABC):
@@ -59,15 +73,17 @@ class BaseDataLoader(ABC):
         self.max_rows = self.config.max_rows
         self.clean_zero_columns = self.config.clean_zero_columns
         self.clean_gauc_lab_columns = self.config.clean_gauc_lab_columns
+        self.cleaned_while_loading = False
         self.df = self.load_data()
         self.column_name_spliting()
-        if self.clean_zero_columns is not None:
+        if self.clean_zero_columns is not None and not self.cleaned_while_loading:
             print( 'clean_zero_columns ', self.clean_zero_columns)
             self.clean_columns_zero(self.clean_zero_columns)
 
         if self.clean_gauc_lab_columns is not None:
             print('clean_gauc_lab_columns ', self.clean_gauc_lab_columns)
             self.clean_columns_gauc_lab(self.clean_gauc_lab_columns)
+        self.n_rows = 0 if self.df is None else self.df.shape[0]
 
     @abstractmethod
     def load_data(self) -> pd.DataFrame:
@@ -95,11 +111,33 @@ class BaseDataLoader(ABC):
 
         :param columns: columns to clean
         """
-        if self.df is not None and columns is not False:
-            self.df[columns] = self.df[columns].fillna(0)
-            self.df = self.df[(self.df[columns] > 0).all(axis=1)]
-            self.df.reset_index(drop=True, inplace=True)
-        self.df = self.df.fillna(0)
+        if self.df is not None:
+            self.df = self.drop_zero_rows(self.df, columns)
+
+    @staticmethod
+    def drop_zero_rows(
+        df: pd.DataFrame, columns: Union[bool, List] = False
+    ) -> pd.DataFrame:
+        """Drop rows that are not positive in all given columns and fill missing values.
+
+        :param df: dataframe
+        :param columns: columns to check
+        """
+        if columns is not False:
+            df[columns] = df[columns].fillna(0)
+            df = df[(df[columns] > 0).all(axis=1)]
+            df.reset_index(drop=True, inplace=True)
+        return df.fillna(0)
+
+    def clean_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Apply the row-wise cleaning steps to a chunk of raw data.
+
+        :param chunk: dataframe chunk
+        """
+        chunk.columns = pd.Index([column.split(".")[-1] for column in chunk.columns])
+        if self.clean_zero_columns is not None:
+            chunk = self.drop_zero_rows(chunk, self.clean_zero_columns)
+        return chunk
 
 
     def clean_columns_gauc_lab(self, columns: Union[bool, dict] = False) -> None:
@@ -129,6 +167,18 @@ class BaseDataLoader(ABC):
 
                 self.df = df_temp
 
+    @staticmethod
+    def downcast_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast float64 columns to float32 and int64 columns to the smallest integer type.
+
+        :param df: dataframe
+        """
+        for column in df.select_dtypes("float64").columns:
+            df[column] = pd.to_numeric(df[column], downcast="float")
+        for column in df.select_dtypes("int64").columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+        return df
+
     @staticmethod
     def clip_and_sum_with_group(
         df: pd.DataFrame, groupby: str, clip_column: str
@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import Dict, List, Optional, Union
 
@@ -5,6 +6,8 @@ import pandas as pd
 
 from .base import BaseDataLoader
 
+logger = logging.getLogger(__name__)
+
 
 class CSVLoader(BaseDataLoader):
     "CSVLoader class for loading CSV files"
@@ -22,19 +25,106 @@ class CSVLoader(BaseDataLoader):
             file_path, file_name, file_type, max_rows, clean_zero_columns, config
         )
 
+    def read_csv(self, file_url: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Read a single CSV file with the configured engine.
+
+        :param file_url: path of the CSV file
+        :param nrows: maximum number of raw rows to read, only used for chunked reading
+        """
+        sep = self.config.file_sep
+        usecols = self.resolve_usecols(file_url)
+        if self.config.chunksize and self.config.engine == "pandas":
+            return self.read_csv_chunked(file_url, nrows, usecols)
+        if self.config.engine == "pyarrow":
+            try:
+                from pyarrow import csv as pa_csv
+
+                table = pa_csv.read_csv(
+                    file_url,
+                    read_options=pa_csv.ReadOptions(
+                        block_size=64 << 20, use_threads=True
+                    ),
+                    parse_options=pa_csv.ParseOptions(delimiter=sep),
+                    convert_options=pa_csv.ConvertOptions(include_columns=usecols),
+                )
+                return table.to_pandas(self_destruct=True, split_blocks=True)
+            except ImportError:
+                logger.warning("pyarrow is not installed, falling back to pandas.")
+        elif self.config.engine == "polars":
+            try:
+                import polars as pl
+
+                return pl.read_csv(file_url, separator=sep, columns=usecols).to_pandas()
+            except ImportError:
+                logger.warning("polars is not installed, falling back to pandas.")
+        return pd.read_csv(file_url, low_memory=False, sep=sep, usecols=usecols)
+
+    def resolve_usecols(self, file_url: str) -> Optional[List[str]]:
+        """Map the configured `usecols` to the raw column names in a CSV header.
+
+        :param file_url: path of the CSV file
+        :return: raw column names to read in file order, or None to read every column
+        """
+        if self.config.usecols is None:
+            return None
+        wanted = set(self.config.usecols)
+        header = pd.read_csv(file_url, sep=self.config.file_sep, nrows=0).columns
+        usecols = [column for column in header if column.split(".")[-1] in wanted]
+        missing = wanted - {column.split(".")[-1] for column in usecols}
+        if missing:
+            logger.warning(f"columns {sorted(missing)} not found in {file_url}")
+        return usecols
+
+    def read_csv_chunked(
+        self,
+        file_url: str,
+        nrows: Optional[int] = None,
+        usecols: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Read a CSV file chunk by chunk, cleaning each chunk before keeping it.
+
+        :param file_url: path of the CSV file
+        :param nrows: maximum number of raw rows to read
+        :param usecols: raw column names to read, None for every column
+        """
+        pieces = []
+        kept_rows = 0
+        self.raw_rows = 0
+        reader = pd.read_csv(
+            file_url,
+            low_memory=False,
+            sep=self.config.file_sep,
+            chunksize=self.config.chunksize,
+            nrows=nrows,
+            usecols=usecols,
+        )
+        for chunk in reader:
+            self.raw_rows += len(chunk)
+            chunk = self.clean_chunk(chunk)
+            kept_rows += len(chunk)
+            pieces.append(chunk)
+            logger.info(f"read {self.raw_rows} rows, kept {kept_rows} from {file_url}")
+        self.cleaned_while_loading = True
+        return pd.concat(pieces, ignore_index=True)
+
     def load_data(self) -> pd.DataFrame:
         """Load data from CSV file."""
         if self.file_name is not None:
             file_url = os.path.join(str(self.file_path), self.file_name) + ".csv"
-            df = pd.read_csv(file_url, low_memory=False, sep=self.config.file_sep)
+            df = self.read_csv(file_url, nrows=self.max_rows)
         else:
             files = os.listdir(self.file_path)
             df_list = []
+            remaining_rows = self.max_rows
             for file in files:
                 if file.endswith(str(self.file_type)):
                     file_url = os.path.join(str(self.file_path), file)
-                    df_list.append(pd.read_csv(file_url, low_memory=False), sep=self.config.file_sep)
-            df = pd.concat(df_list)
+                    df_list.append(self.read_csv(file_url, nrows=remaining_rows))
+                    if remaining_rows is not None and self.cleaned_while_loading:
+                        remaining_rows -= self.raw_rows
+                        if remaining_rows <= 0:
+                            break
+            df = pd.concat(df_list, ignore_index=self.cleaned_while_loading)
         if self.max_rows is not None:
             max_rows = min(self.max_rows, df.shape[0])
         else:
@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import Dict, List, Optional, Union
 
@@ -5,6 +6,8 @@ import pandas as pd
 
 from .base import BaseDataLoader
 
+logger = logging.getLogger(__name__)
+
 
 class ExcelLoader(BaseDataLoader):
     "ExcelLoader class for loading excel files"
@@ -22,18 +25,57 @@ class ExcelLoader(BaseDataLoader):
             file_path, file_name, file_type, max_rows, clean_zero_columns, config
         )
 
+    @staticmethod
+    def read_excel(file_url: str, parquet_cache: bool = False) -> pd.DataFrame:
+        """Read a single excel file, using the calamine engine when it is installed.
+
+        With `parquet_cache`, the sheet is also saved as `<stem>.paradance.parquet`
+        next to the workbook and read from there while it is newer than the workbook.
+
+        :param file_url: path of the excel file
+        :param parquet_cache: whether to read and write the Parquet copy
+        """
+        cache_url = os.path.splitext(file_url)[0] + ".paradance.parquet"
+        if (
+            parquet_cache
+            and os.path.exists(cache_url)
+            and os.path.getmtime(cache_url) > os.path.getmtime(file_url)
+        ):
+            try:
+                return pd.read_parquet(cache_url)
+            except (ImportError, OSError, TypeError, ValueError) as e:
+                logger.warning(f"could not read parquet copy of {file_url}: {e}")
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            df = pd.read_excel(file_url)
+        else:
+            df = pd.read_excel(file_url, engine="calamine")
+        if parquet_cache:
+            tmp_url = f"{cache_url}.{os.getpid()}.tmp"
+            try:
+                df.to_parquet(tmp_url, compression="zstd")
+                os.replace(tmp_url, cache_url)
+            except (ImportError, OSError, TypeError, ValueError) as e:
+                logger.warning(f"could not write parquet copy of {file_url}: {e}")
+                if os.path.exists(tmp_url):
+                    os.remove(tmp_url)
+        return df
+
     def load_data(self) -> pd.DataFrame:
         """Load data from excel file."""
         if self.file_name is not None:
             file_url = os.path.join(str(self.file_path), self.file_name) + ".xlsx"
-            df = pd.read_excel(file_url)
+            df = self.read_excel(file_url, self.config.excel_parquet_cache)
         else:
             files = os.listdir(self.file_path)
             df_list = []
             for file in files:
                 if file.endswith(str(self.file_type)):
                     file_url = os.path.join(str(self.file_path), file)
-                    df_list.append(pd.read_excel(file_url))
+                    df_list.append(
+                        self.read_excel(file_url, self.config.excel_parquet_cache)
+                    )
             df = pd.concat(df_list)
         if self.max_rows is not None:
             max_rows = min(self.max_rows, df.shape[0])
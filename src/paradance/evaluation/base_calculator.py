@@ -1,6 +1,7 @@
+import threading
 from abc import ABCMeta, abstractmethod
 from functools import partialmethod
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -49,13 +50,57 @@ class BaseCalculator(metaclass=ABCMeta):
     calculate_woauc = partialmethod(calculate_woauc)
     calculate_wuauc = partialmethod(calculate_wuauc)
 
+    df: pd.DataFrame
+
     def __init__(self, selected_columns: List[str]) -> None:
         """Initializes the BaseCalculator."""
         self.selected_columns = selected_columns
-        self.evaluated_dataframe: pd.DataFrame = pd.DataFrame()
+        self._evaluation_state = threading.local()
         self.samplers: dict = {}
         self.woauc_dict: dict = {}
-        self.bin_mappings: dict = {}
+        self.bin_mappings: Dict[Tuple[str, int], np.ndarray] = {}
+        self.evaluated_totals: Dict[Tuple[str, Optional[str], str], float] = {}
+        self.evaluated_arrays: Dict[Tuple[str, Optional[str]], np.ndarray] = {}
+        self.mask_positions: Dict[str, np.ndarray] = {}
+        self.group_codes: Dict[str, Tuple[np.ndarray, pd.Index]] = {}
+        self.group_slices: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._evaluated_source: Optional[pd.DataFrame] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_evaluation_state"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._evaluation_state = threading.local()
+
+    @property
+    def evaluated_dataframe(self) -> pd.DataFrame:
+        """The DataFrame prepared for the evaluator running in the current thread."""
+        return getattr(self._evaluation_state, "dataframe", pd.DataFrame())
+
+    @evaluated_dataframe.setter
+    def evaluated_dataframe(self, dataframe: pd.DataFrame) -> None:
+        self._evaluation_state.dataframe = dataframe
+
+    @property
+    def evaluated_positions(self) -> Optional[np.ndarray]:
+        """Row positions of `evaluated_dataframe` in `df`, or None if every row is kept."""
+        return getattr(self._evaluation_state, "positions", None)
+
+    @evaluated_positions.setter
+    def evaluated_positions(self, positions: Optional[np.ndarray]) -> None:
+        self._evaluation_state.positions = positions
+
+    @property
+    def evaluated_mask_column(self) -> Optional[str]:
+        """The mask applied to `evaluated_dataframe` in the current thread."""
+        return getattr(self._evaluation_state, "mask_column", None)
+
+    @evaluated_mask_column.setter
+    def evaluated_mask_column(self, mask_column: Optional[str]) -> None:
+        self._evaluation_state.mask_column = mask_column
 
     @abstractmethod
     def get_overall_score(self, weights_for_equation: List[float]) -> None:
@@ -64,6 +109,127 @@ class BaseCalculator(metaclass=ABCMeta):
         """
         pass
 
+    def _sync_evaluated_caches(self) -> None:
+        """Drops the cached totals, arrays, masks and groups if `df` has been replaced."""
+        if self._evaluated_source is not self.df:
+            self.evaluated_totals = {}
+            self.evaluated_arrays = {}
+            self.mask_positions = {}
+            self.group_codes = {}
+            self.group_slices = {}
+            self._evaluated_source = self.df
+
+    def get_mask_positions(self, mask_column: Optional[str]) -> Optional[np.ndarray]:
+        """Returns the row positions where a mask column is non-zero.
+
+        Mask columns do not change between trials, so the positions are computed
+        once per column.
+
+        Args:
+            mask_column (Optional[str]): The mask column.
+
+        Returns:
+            Optional[np.ndarray]: The kept row positions, or None if no mask applies.
+        """
+        if not mask_column or mask_column not in self.df.columns:
+            return None
+        self._sync_evaluated_caches()
+        positions = self.mask_positions.get(mask_column)
+        if positions is None:
+            positions = np.flatnonzero(self.df[mask_column].to_numpy() != 0)
+            self.mask_positions[mask_column] = positions
+        return positions
+
+    def get_group_codes(self, groupby: str) -> Tuple[np.ndarray, pd.Index]:
+        """Returns the factorized group keys of `df`.
+
+        Group keys do not change between trials, so every column is factorized
+        once. Keys are sorted, and rows with a missing key get code -1, matching
+        the groups produced by `DataFrame.groupby`.
+
+        Args:
+            groupby (str): The column to group by.
+
+        Returns:
+            Tuple[np.ndarray, pd.Index]: The group code of each row and the sorted group keys.
+        """
+        self._sync_evaluated_caches()
+        cached = self.group_codes.get(groupby)
+        if cached is None:
+            codes, uniques = pd.factorize(self.df[groupby], sort=True)
+            cached = (codes, pd.Index(uniques))
+            self.group_codes[groupby] = cached
+        return cached
+
+    def get_group_slices(self, groupby: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns a row order of `df` that makes every group contiguous.
+
+        Rows of group `i` are `order[offsets[i]:offsets[i + 1]]`, in their original
+        order. Rows with a missing key are left out.
+
+        Args:
+            groupby (str): The column to group by.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The row order and the group offsets into it.
+        """
+        codes, uniques = self.get_group_codes(groupby)
+        cached = self.group_slices.get(groupby)
+        if cached is None:
+            order = np.argsort(codes, kind="stable")
+            offsets = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            cached = (order[offsets[0] :], offsets - offsets[0])
+            self.group_slices[groupby] = cached
+        return cached
+
+    def get_arrays(
+        self, pd_column: str, target_column: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the score and target columns of the evaluated DataFrame as NumPy arrays.
+
+        Scores change with every trial and are read on each call, while the target
+        array is cached per column and mask like the totals.
+
+        Args:
+            pd_column (str): The score column.
+            target_column (str): The target column.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The score values and the target values.
+        """
+        self._sync_evaluated_caches()
+        key = (target_column, self.evaluated_mask_column)
+        target_values = self.evaluated_arrays.get(key)
+        if target_values is None:
+            target_values = self.evaluated_dataframe[target_column].to_numpy()
+            self.evaluated_arrays[key] = target_values
+        return self.evaluated_dataframe[pd_column].to_numpy(), target_values
+
+    def get_evaluated_total(self, column: str, how: str = "sum") -> float:
+        """Returns the sum or the distinct count of a column in the evaluated DataFrame.
+
+        Target columns do not change between trials, so the total is cached per
+        column and mask, and the cache is reset whenever `df` is replaced.
+
+        Args:
+            column (str): The column to aggregate.
+            how (str, optional): Either "sum" or "nunique". Defaults to "sum".
+
+        Returns:
+            float: The aggregated value.
+        """
+        self._sync_evaluated_caches()
+        key = (column, self.evaluated_mask_column, how)
+        if key not in self.evaluated_totals:
+            values = self.evaluated_dataframe[column]
+            if how == "sum":
+                self.evaluated_totals[key] = float(values.sum())
+            elif how == "nunique":
+                self.evaluated_totals[key] = float(values.nunique())
+            else:
+                raise ValueError(f"Unsupported aggregation: {how}")
+        return self.evaluated_totals[key]
+
     @staticmethod
     def clip_max(
         left: Union[np.ndarray, float, int], right: Union[np.ndarray, float, int]
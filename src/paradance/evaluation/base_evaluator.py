@@ -28,11 +28,14 @@ def evaluation_preprocessor(func: F) -> F:
         *args: Any,
         **kwargs: Any
     ) -> Any:
-        if mask_column and mask_column in calculator.df.columns:
-            masked_indices = calculator.df[calculator.df[mask_column] != 0].index
+        positions = calculator.get_mask_positions(mask_column)
+        if positions is not None:
+            calculator.evaluated_dataframe = calculator.df.iloc[positions]
+            calculator.evaluated_mask_column = mask_column
         else:
-            masked_indices = calculator.df.index
-        calculator.evaluated_dataframe = calculator.df.loc[masked_indices]
+            calculator.evaluated_dataframe = calculator.df
+            calculator.evaluated_mask_column = None
+        calculator.evaluated_positions = positions
         return func(calculator, target_column, *args, **kwargs)
 
     return cast(F, wrapper)
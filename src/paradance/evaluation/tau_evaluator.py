@@ -27,16 +27,18 @@ def map_to_bins(
     if len(data) == 0:
         return np.array([])
 
-    if np.all(data == 0):
-        return np.zeros_like(data)
+    non_zero_mask = data != 0
+    if not non_zero_mask.any():
+        return np.zeros(data.shape, dtype=np.int32)
 
-    non_zero_data: np.ndarray = data[data != 0]
+    non_zero_data: np.ndarray = data[non_zero_mask]
     num_bins = min(num_bins, len(non_zero_data))
     quantiles = np.linspace(0, 1, num_bins + 1)[1:-1]
-    non_zero_bins = np.digitize(non_zero_data, np.quantile(non_zero_data, quantiles))
+    thresholds = np.quantile(non_zero_data, quantiles)
+    non_zero_bins = np.searchsorted(thresholds, non_zero_data, side="right")
 
-    bins = np.zeros_like(data)
-    bins[data != 0] = non_zero_bins + 1
+    bins = np.zeros(data.shape, dtype=np.int32)
+    bins[non_zero_mask] = non_zero_bins + 1
 
     return bins
 
@@ -52,7 +54,7 @@ def calculate_tau(
     """
     Calculate the Kendall's Tau using binned data.
 
-    :param calculator: Calculator object. Stores the DataFrame and any existing bin mappings.
+    :param calculator: Calculator object. Stores the DataFrame and any existing bin mappings, keyed by (target_column, num_bins).
     :param target_column: String. The column name in the DataFrame that you want to target.
     :param groupby: Optional string. The column name to group by.
     :param weights_for_groups: Optional pd.Series. Weights for each group.
@@ -64,23 +66,29 @@ def calculate_tau(
         num_bins = int(min(unique_bins, 100))
     else:
         num_bins = int(num_bins)
-    if target_column in calculator.bin_mappings:
-        label_bins = calculator.bin_mappings[target_column]
-    else:
+    key = (target_column, num_bins)
+    label_bins = calculator.bin_mappings.get(key)
+    if label_bins is None:
         label_bins = map_to_bins(pd.Series(calculator.df[target_column]), num_bins)
-        calculator.bin_mappings[target_column] = label_bins
+        calculator.bin_mappings[key] = label_bins
     if groupby is not None:
-        calculator.df[f"{target_column}_bin"] = label_bins
-        grouped = calculator.df.groupby(groupby).apply(
-            lambda x: float(
-                kendalltau(x[f"{target_column}_bin"], x[pd_column])[0]
-            )
+        _, uniques = calculator.get_group_codes(groupby)
+        order, offsets = calculator.get_group_slices(groupby)
+        bins_sorted = np.asarray(label_bins)[order]
+        scores_sorted = calculator.df[pd_column].values[order]
+        grouped = np.array(
+            [
+                float(kendalltau(bins_sorted[s:e], scores_sorted[s:e])[0])
+                for s, e in zip(offsets[:-1], offsets[1:])
+            ]
         )
         if weights_for_groups is not None:
-            counts_sorted = weights_for_groups.loc[grouped.index]
+            counts_sorted = weights_for_groups.loc[uniques]
             tau = float(np.average(grouped, weights=counts_sorted.values))
         else:
-            tau = float(np.mean(grouped))
+            # groups with a single row or a constant target give NaN, which the
+            # groupby Series mean used to skip
+            tau = float(np.nanmean(grouped))
     else:
         overall_score_bins = map_to_bins(calculator.df[pd_column], num_bins)
         tau, _ = kendalltau(label_bins, overall_score_bins)
@@ -8,6 +8,13 @@ if TYPE_CHECKING:
     from .calculator import Calculator
 
 
+def _top_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Returns the positions of the `k` largest values, ranking NaN last like `sort_values`."""
+    if values.dtype.kind == "f":
+        values = np.where(np.isnan(values), -np.inf, values)
+    return np.argpartition(values, -k)[-k:]
+
+
 @evaluation_preprocessor
 def calculate_top_coverage(
     calculator: "Calculator",
@@ -30,11 +37,14 @@ def calculate_top_coverage(
     if head_percentage is None:
         head_percentage = 0.05
 
-    df = calculator.evaluated_dataframe
-    df = df.sort_values(pd_column, ascending=False)
-    total_sum = df[target_column].sum()
-    top_rows_count = int(len(df) * head_percentage)
-    top_sum = df.iloc[:top_rows_count][target_column].sum()
+    pd_values, target_values = calculator.get_arrays(pd_column, target_column)
+    total_sum = calculator.get_evaluated_total(target_column)
+    top_rows_count = int(len(pd_values) * head_percentage)
+    if top_rows_count > 0:
+        top_indices = _top_indices(pd_values, top_rows_count)
+        top_sum = np.nansum(target_values[top_indices])
+    else:
+        top_sum = 0.0
     top_coverage_ratio = top_sum / total_sum
 
     return float(top_coverage_ratio)
@@ -62,15 +72,15 @@ def calculate_distinct_top_coverage(
     if head_percentage is None:
         head_percentage = 0.05
 
-    df = calculator.evaluated_dataframe
-    total_ids = df[target_column].nunique()
+    pd_values, target_values = calculator.get_arrays(pd_column, target_column)
+    total_ids = calculator.get_evaluated_total(target_column, how="nunique")
 
-    df_sorted = df.sort_values(by=pd_column, ascending=False).reset_index(
-        drop=True
-    )
-    df_sorted["is_unique"] = ~df_sorted[target_column].duplicated()
-    top_rows_count = int(len(df) * head_percentage)
-    top_sum = df_sorted.iloc[:top_rows_count]["is_unique"].sum()
+    top_rows_count = int(len(pd_values) * head_percentage)
+    if top_rows_count > 0:
+        top_indices = _top_indices(pd_values, top_rows_count)
+        top_sum = pd.unique(target_values[top_indices]).size
+    else:
+        top_sum = 0
 
     top_coverage_ratio = top_sum / total_ids
 
@@ -88,20 +98,12 @@ def pd_data_group_top_n(data: pd.DataFrame, group_cols: list, val_cols: list, as
     :param k: 取前k项值
     :return: 返回topN数据框
     """
-    # 为了能返回传入数据框的原index，将index保存至values中
-    datac = data.reset_index().copy()
-    index_colname = datac.columns[0]
-    # 对原数据框进行排序
-    datac.sort_values(group_cols + val_cols, ascending=ascending, inplace=True)
-    # 主要代码：分组对组内进行编号
-    rank0 = np.hstack(datac.value_counts(group_cols, sort=False).map(lambda x: range(x)).values)
-    # 取topN值
-    datac = datac[rank0 < k]
-    # 取出原index重置为index值
-    datac.index = datac[index_colname].values
-    # 删除额外生成的index值的列
-    del datac[index_colname]
-    return datac
+    # 排序后按组取前k项，groupby.head 会保留传入数据框的原index
+    return (
+        data.sort_values(group_cols + val_cols, ascending=ascending)
+        .groupby(group_cols, sort=False)
+        .head(k)
+    )
 
 
 @evaluation_preprocessor
@@ -128,7 +130,7 @@ def calculate_top_n_coverage(
         top_n = 100
 
     df = calculator.evaluated_dataframe
-    total_sum = df[target_column].sum()
+    total_sum = calculator.get_evaluated_total(target_column)
     # print( '***'*10 + 'calculate_top_n_coverage total_sum', total_sum)
     group_top_df = pd_data_group_top_n(data=df, group_cols=[groupby], val_cols=[pd_column], ascending=False, k=top_n)
     # print( '***'*10 + 'calculate_top_n_coverage group_top_df', len(group_top_df))
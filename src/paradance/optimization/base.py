@@ -25,6 +25,10 @@ class BaseObjectiveConfig(BaseModel):
         study_name (Optional[str]): The name of the optimization study. Default is None.
         study_path (Optional[str]): Filesystem path where study results are stored. Default is None.
         save_study (Optional[bool]): Flag indicating whether to persist the study to disk. Defaults to True.
+        storage_url (Optional[str]): Database URL of an Optuna storage shared across runs, e.g. 'sqlite:///paradance.db'.
+                                     With a fixed `study_name`, later runs resume the study and add their trials to it.
+                                     Default is None, which creates a new SQLite storage in the study directory.
+        multivariate_tpe (bool): Whether to sample with a multivariate, grouped TPE sampler. Defaults to False.
     """
 
     direction: Optional[str] = None
@@ -36,6 +40,8 @@ class BaseObjectiveConfig(BaseModel):
     study_name: Optional[str] = None
     study_path: Optional[str] = None
     save_study: Optional[bool] = True
+    storage_url: Optional[str] = None
+    multivariate_tpe: bool = False
 
 
 class BaseObjective(metaclass=ABCMeta):
@@ -79,6 +85,8 @@ class BaseObjective(metaclass=ABCMeta):
         study_name: Optional[str] = None,
         study_path: Optional[str] = None,
         save_study: Optional[bool] = True,
+        storage_url: Optional[str] = None,
+        multivariate_tpe: bool = False,
         config: Optional[Dict] = None,
     ) -> None:
         """
@@ -94,6 +102,8 @@ class BaseObjective(metaclass=ABCMeta):
             dirichlet (bool, optional): Use Dirichlet distribution. Defaults to False.
             study_name (Optional[str], optional): Name of the study. Defaults to None.
             study_path (Optional[str], optional): Path to the study directory. Defaults to None.
+            storage_url (Optional[str], optional): URL of a persistent Optuna storage. Defaults to None.
+            multivariate_tpe (bool, optional): Use a multivariate, grouped TPE sampler. Defaults to False.
         """
         self.calculator = calculator
         if config is not None:
@@ -109,6 +119,8 @@ class BaseObjective(metaclass=ABCMeta):
                 study_name=study_name,
                 study_path=study_path,
                 save_study=save_study,
+                storage_url=storage_url,
+                multivariate_tpe=multivariate_tpe,
             )
 
         self.direction = self.config.direction
@@ -120,6 +132,8 @@ class BaseObjective(metaclass=ABCMeta):
         self.study_name = self.config.study_name
         self.study_path = self.config.study_path
         self.save_study = self.config.save_study
+        self.storage_url = self.config.storage_url
+        self.multivariate_tpe = self.config.multivariate_tpe
         self._prepare_study()
 
     def _prepare_study(self) -> None:
@@ -127,7 +141,8 @@ class BaseObjective(metaclass=ABCMeta):
         Prepares the study by setting up the study directory, storage, and the study object itself.
 
         This method configures the study by ensuring the study directory exists and initializing the study with the
-        specified direction, name, and storage backend. If `weights_num` is not already defined, it determines the number
+        specified direction, name, and storage backend. When `storage_url` is set, an existing study of the same
+        name is loaded from it, so new trials extend the earlier ones. If `weights_num` is not already defined, it determines the number
         of weights. Finally, it initializes the `best_params` attribute as a zero array of size `weights_num`.
 
         Side effects:
@@ -139,14 +154,23 @@ class BaseObjective(metaclass=ABCMeta):
             - Initializes `self.best_params` as a NumPy zero array of size `self.weights_num`.
         """
         self.full_path = ensure_study_directory(self.study_path, self.study_name)
+        url = self.storage_url or f"sqlite:///{self.full_path}/paradance_storage.db"
         storage = optuna.storages.RDBStorage(
-            url=f"sqlite:///{self.full_path}/paradance_storage.db",
-            engine_kwargs={"connect_args": {"timeout": 60}},
+            url=url,
+            engine_kwargs=(
+                {"connect_args": {"timeout": 60}} if url.startswith("sqlite") else {}
+            ),
+        )
+        sampler = (
+            optuna.samplers.TPESampler(multivariate=True, group=True)
+            if self.multivariate_tpe
+            else None
         )
         self.study = optuna.create_study(
             direction=self.direction,
             study_name=self.study_name,
             storage=storage,
+            sampler=sampler,
             load_if_exists=True,
         )
         if self.weights_num is None:
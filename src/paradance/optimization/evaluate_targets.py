@@ -1,10 +1,295 @@
-from typing import List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..evaluation import Calculator, LogarithmPCACalculator
 
+CalculatorType = Union[Calculator, LogarithmPCACalculator]
+
+
+def _evaluate_pearson(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_corrcoef(
+            target_column=target_column,
+            mask_column=mask_column,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_portfolio(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    _, concentration = calculator.calculate_portfolio_concentration(
+        target_column=target_column,
+        mask_column=mask_column,
+        expected_return=hyperparameter,
+        pd_column=pd_score_column,
+    )
+    return float(concentration)
+
+
+def _evaluate_distinct_count_portfolio(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    (
+        _,
+        concentration,
+    ) = calculator.calculate_distinct_count_portfolio_concentration(
+        target_column=target_column,
+        mask_column=mask_column,
+        expected_coverage=hyperparameter,
+        pd_column=pd_score_column,
+    )
+    return float(concentration)
+
+
+def _evaluate_top_coverage(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_top_coverage(
+            target_column=target_column,
+            mask_column=mask_column,
+            head_percentage=hyperparameter,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_top_n_coverage(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_top_n_coverage(
+            target_column=target_column,
+            mask_column=mask_column,
+            groupby=groupby,
+            top_n=hyperparameter,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_distinct_top_coverage(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_distinct_top_coverage(
+            target_column=target_column,
+            mask_column=mask_column,
+            head_percentage=hyperparameter,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_wuauc(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_wuauc(
+            target_column=target_column,
+            mask_column=mask_column,
+            groupby=groupby,
+            weights_for_equation=weights,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_auc(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_wuauc(
+            target_column=target_column,
+            mask_column=mask_column,
+            groupby=groupby,
+            weights_for_equation=weights,
+            auc=True,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_woauc(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    woauc = calculator.calculate_woauc(
+        target_column=target_column,
+        groupby=groupby,
+        weights_for_equation=weights,
+        pd_column=pd_score_column,
+    )
+    return float(sum(woauc))
+
+
+def _evaluate_logmse(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_log_mse(
+            target_column=target_column,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_neg_rank_ratio(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_neg_rank_ratio(
+            weights_for_equation=weights,
+            label_column=target_column,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_inverse_pairs(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_inverse_pair(
+            calculator=calculator,
+            weights_for_equation=weights,
+            weights_type=evaluator_property,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+def _evaluate_tau(
+    calculator: CalculatorType,
+    target_column: str,
+    mask_column: Optional[str],
+    hyperparameter: Optional[float],
+    evaluator_property: Optional[str],
+    groupby: Optional[str],
+    weights: List[float],
+    pd_score_column: str,
+) -> float:
+    return float(
+        calculator.calculate_tau(
+            groupby=groupby,
+            target_column=target_column,
+            num_bins=hyperparameter,
+            pd_column=pd_score_column,
+        )
+    )
+
+
+_EVALUATORS: Dict[str, Callable[..., float]] = {
+    "pearson": _evaluate_pearson,
+    "portfolio": _evaluate_portfolio,
+    "distinct_count_portfolio": _evaluate_distinct_count_portfolio,
+    "top_coverage": _evaluate_top_coverage,
+    "top_n_coverage": _evaluate_top_n_coverage,
+    "distinct_top_coverage": _evaluate_distinct_top_coverage,
+    "wuauc": _evaluate_wuauc,
+    "auc": _evaluate_auc,
+    "woauc": _evaluate_woauc,
+    "logmse": _evaluate_logmse,
+    "neg_rank_ratio": _evaluate_neg_rank_ratio,
+    "inverse_pairs": _evaluate_inverse_pairs,
+    "tau": _evaluate_tau,
+}
+
+
+def _run_evaluator(task: Tuple[Callable[..., float], Tuple[Any, ...]]) -> float:
+    evaluator, args = task
+    return evaluator(*args)
+
 
 def evaluate_targets(
-    calculator: Union[Calculator, LogarithmPCACalculator],
+    calculator: CalculatorType,
     evaluator_flags: List[str],
     target_columns: List[str],
     mask_columns: List[Optional[str]],
@@ -13,8 +298,16 @@ def evaluate_targets(
     groupbys: List[Optional[str]],
     weights: List[float],
     pd_score_columns: List[str],
+    max_workers: int = 1,
 ) -> List[float]:
-    targets = []
+    """
+    Runs every registered evaluator and returns their results in order.
+
+    When `max_workers` is greater than one, the evaluators are run on a thread
+    pool. The NumPy, pandas and SciPy routines they rely on mostly release the
+    GIL, so independent targets can be computed concurrently.
+    """
+    tasks = []
     for (
         flag,
         mask_column,
@@ -32,119 +325,24 @@ def evaluate_targets(
         target_columns,
         pd_score_columns,
     ):
-        if flag == "pearson":
-            corrcoef = calculator.calculate_corrcoef(
-                target_column=target_column,
-                mask_column=mask_column,
-                pd_column=pd_score_column,
-            )
-            targets.append(corrcoef)
-
-        elif flag == "portfolio":
-            _, concentration = calculator.calculate_portfolio_concentration(
-                target_column=target_column,
-                mask_column=mask_column,
-                expected_return=hyperparameter,
-                pd_column=pd_score_column,
-            )
-            targets.append(concentration)
-
-        elif flag == "distinct_count_portfolio":
-            (
-                _,
-                concentration,
-            ) = calculator.calculate_distinct_count_portfolio_concentration(
-                target_column=target_column,
-                mask_column=mask_column,
-                expected_coverage=hyperparameter,
-                pd_column=pd_score_column,
-            )
-            targets.append(concentration)
-
-        elif flag == "top_coverage":
-            top_coverage = calculator.calculate_top_coverage(
-                target_column=target_column,
-                mask_column=mask_column,
-                head_percentage=hyperparameter,
-                pd_column=pd_score_column,
-            )
-            targets.append(top_coverage)
-
-        elif flag == "top_n_coverage":
-            top_n_coverage = calculator.calculate_top_n_coverage(
-                target_column=target_column,
-                mask_column=mask_column,
-                groupby=groupby,
-                top_n=hyperparameter,
-                pd_column=pd_score_column,
-            )
-            targets.append(top_n_coverage)
-
-        elif flag == "distinct_top_coverage":
-            distinct_top_coverage = calculator.calculate_distinct_top_coverage(
-                target_column=target_column,
-                mask_column=mask_column,
-                head_percentage=hyperparameter,
-                pd_column=pd_score_column,
-            )
-            targets.append(distinct_top_coverage)
-
-        elif flag == "wuauc":
-            wuauc = calculator.calculate_wuauc(
-                target_column=target_column,
-                mask_column=mask_column,
-                groupby=groupby,
-                weights_for_equation=weights,
-                pd_column=pd_score_column,
-            )
-            targets.append(wuauc)
-
-        elif flag == "auc":
-            auc = calculator.calculate_wuauc(
-                target_column=target_column,
-                mask_column=mask_column,
-                groupby=groupby,
-                weights_for_equation=weights,
-                auc=True,
-                pd_column=pd_score_column,
-            )
-            targets.append(auc)
-
-        elif flag == "woauc":
-            woauc = calculator.calculate_woauc(
-                target_column=target_column,
-                groupby=groupby,
-                weights_for_equation=weights,
-                pd_column=pd_score_column,
-            )
-            targets.append(sum(woauc))
-
-        elif flag == "logmse":
-            mse = calculator.calculate_log_mse(
-                target_column=target_column, pd_column=pd_score_column,
-            )
-            targets.append(mse)
-        elif flag == "neg_rank_ratio":
-            neg_rank_ratio = calculator.calculate_neg_rank_ratio(
-                weights_for_equation=weights, label_column=target_column, pd_column=pd_score_column,
-            )
-            targets.append(neg_rank_ratio)
-
-        elif flag == "inverse_pairs":
-            inverse_score = calculator.calculate_inverse_pair(
-                calculator=calculator,
-                weights_for_equation=weights,
-                weights_type=evaluator_property,
-                pd_column=pd_score_column,
-            )
-            targets.append(inverse_score)
-
-        elif flag == "tau":
-            tau = calculator.calculate_tau(
-                groupby=groupby,
-                target_column=target_column,
-                num_bins=hyperparameter,
-                pd_column=pd_score_column,
+        evaluator = _EVALUATORS.get(flag)
+        if evaluator is not None:
+            tasks.append(
+                (
+                    evaluator,
+                    (
+                        calculator,
+                        target_column,
+                        mask_column,
+                        hyperparameter,
+                        evaluator_property,
+                        groupby,
+                        weights,
+                        pd_score_column,
+                    ),
+                )
             )
-            targets.append(tau)
-    return targets
+    if max_workers > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            return list(executor.map(_run_evaluator, tasks))
+    return [_run_evaluator(task) for task in tasks]
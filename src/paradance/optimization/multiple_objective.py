@@ -1,5 +1,6 @@
 from functools import partialmethod
-from typing import Dict, List, Optional, Union
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from optuna.trial import Trial
 
@@ -27,6 +28,7 @@ class MultipleObjectiveConfig(BaseObjectiveConfig):
         power_upper_bound (Union[float, List[float]]): The upper bound for the power objective.
         pca_importance_lower_bound (float): The lower bound for PCA importance.
         pca_importance_upper_bound (float): The upper bound for PCA importance.
+        evaluator_threads (int): The number of threads used to run the evaluators of a trial. Defaults to 1, which runs them sequentially.
     """
 
     first_order_with_scales: bool = True
@@ -43,6 +45,7 @@ class MultipleObjectiveConfig(BaseObjectiveConfig):
     power_upper_bound: Union[float, List[float]] = 1
     pca_importance_lower_bound: float = 0
     pca_importance_upper_bound: float = 10
+    evaluator_threads: int = 1
 
 
 class MultipleObjective(BaseObjective):
@@ -64,6 +67,8 @@ class MultipleObjective(BaseObjective):
         study_name: Optional[str] = None,
         study_path: Optional[str] = None,
         save_study: Optional[bool] = True,
+        storage_url: Optional[str] = None,
+        multivariate_tpe: bool = False,
         first_order_with_scales: bool = True,
         first_order_lower_bound: float = 1e-3,
         first_order_upper_bound: float = 1e6,
@@ -78,12 +83,15 @@ class MultipleObjective(BaseObjective):
         power_upper_bound: Union[float, List[float]] = 1,
         pca_importance_lower_bound: float = 0,
         pca_importance_upper_bound: float = 10,
+        evaluator_threads: int = 1,
         config: Optional[Dict] = None,
     ) -> None:
         """
         Initialize with direction, weights_num, formula, and dirichlet.
 
         Args:
+            storage_url (Optional[str], optional): URL of a persistent Optuna storage; a study with the same name is resumed. Defaults to None.
+            multivariate_tpe (bool, optional): Use a multivariate, grouped TPE sampler. Defaults to False.
             first_order_with_scales (bool, optional): Whether to use scales-control in the first-order objective. Defaults to True.
             first_order_lower_bound (float, optional): Lower bound for first order value. Defaults to 1e-3.
             first_order_upper_bound (float, optional): Upper bound for first order value. Defaults to 1e6.
@@ -91,6 +99,7 @@ class MultipleObjective(BaseObjective):
             power_upper_bound (Union[float, List[float]]): Upper bound for power value. Defaults to 1.
             pca_importance_lower_bound (float, optional): Lower bound for pca importance value. Defaults to 0.
             pca_importance_upper_bound (float, optional): Upper bound for pca importance value. Defaults to 10.
+            evaluator_threads (int, optional): Number of threads used to run the evaluators of a trial. Defaults to 1.
             first_order_scale_bound (Optional[float], optional): Scale bound for first order value. Defaults to None.
         """
 
@@ -107,6 +116,8 @@ class MultipleObjective(BaseObjective):
                 study_name=study_name,
                 study_path=study_path,
                 save_study=save_study,
+                storage_url=storage_url,
+                multivariate_tpe=multivariate_tpe,
                 first_order_with_scales=first_order_with_scales,
                 first_order_lower_bound=first_order_lower_bound,
                 first_order_upper_bound=first_order_upper_bound,
@@ -121,6 +132,7 @@ class MultipleObjective(BaseObjective):
                 power_upper_bound=power_upper_bound,
                 pca_importance_lower_bound=pca_importance_lower_bound,
                 pca_importance_upper_bound=pca_importance_upper_bound,
+                evaluator_threads=evaluator_threads,
             )
         self.calculator = calculator
         self.direction = self.config.direction
@@ -132,6 +144,8 @@ class MultipleObjective(BaseObjective):
         self.study_name = self.config.study_name
         self.study_path = self.config.study_path
         self.save_study = self.config.save_study
+        self.storage_url = self.config.storage_url
+        self.multivariate_tpe = self.config.multivariate_tpe
         self.first_order_lower_bound = self.config.first_order_lower_bound
         self.first_order_upper_bound = self.config.first_order_upper_bound
         self.first_order_with_scales = self.config.first_order_with_scales
@@ -146,6 +160,7 @@ class MultipleObjective(BaseObjective):
         self.power_upper_bound = self.config.power_upper_bound
         self.pca_importance_lower_bound = self.config.pca_importance_lower_bound
         self.pca_importance_upper_bound = self.config.pca_importance_upper_bound
+        self.evaluator_threads = self.config.evaluator_threads
 
         self.target_columns: List[str] = []
         self.mask_columns: List[Optional[str]] = []
@@ -199,6 +214,50 @@ class MultipleObjective(BaseObjective):
         else:
             self.evaluator_propertys.append(None)
 
+    def add_evaluators(
+        self,
+        flags: Sequence[str],
+        target_columns: Sequence[str],
+        mask_columns: Sequence[Optional[str]],
+        hyperparameters: Sequence[Optional[float]],
+        evaluator_propertys: Sequence[Optional[str]],
+        groupbys: Sequence[Optional[str]],
+    ) -> None:
+        """
+        Adds several evaluators at once and prepares the data they share.
+
+        Shorter lists are padded with None. Row positions of every distinct mask
+        column and the group codes of every groupby column are computed once here
+        instead of on the first trial of each evaluator.
+
+        Args:
+            flags (Sequence[str]): Types of calculator, one per evaluator.
+            target_columns (Sequence[str]): The target columns for calculation.
+            mask_columns (Sequence[Optional[str]]): The mask columns.
+            hyperparameters (Sequence[Optional[float]]): Hyperparameters for the calculators.
+            evaluator_propertys (Sequence[Optional[str]]): Properties of the evaluators.
+            groupbys (Sequence[Optional[str]]): Grouping criteria.
+        """
+        # Pack rows in add_evaluator's parameter order and call positionally.
+        rows: List[Tuple[Any, ...]] = list(
+            zip_longest(
+                flags,
+                target_columns,
+                mask_columns,
+                hyperparameters,
+                evaluator_propertys,
+                groupbys,
+            )
+        )
+        add = self.add_evaluator
+        for row in rows:
+            add(*row)
+        for mask_column in set(self.mask_columns):
+            self.calculator.get_mask_positions(mask_column)
+        for groupby in set(self.groupbys):
+            if groupby is not None and groupby in self.calculator.df.columns:
+                self.calculator.get_group_codes(groupby)
+
     def evaluate_custom_weights(self, weights: List[float], pd_column:str = 'overall_score') -> List[float]:
         """
         Evaluate the objective function with custom weights.
@@ -220,7 +279,10 @@ class MultipleObjective(BaseObjective):
             groupbys=self.groupbys,
             target_columns=self.target_columns,
             weights=weights,
-            pd_score_columns=[pd_column for i in enumerate(range(len(self.evaluator_flags)))]
+            pd_score_columns=[
+                pd_column for i in enumerate(range(len(self.evaluator_flags)))
+            ],
+            max_workers=self.evaluator_threads,
         )
 
         return targets
@@ -243,7 +305,10 @@ class MultipleObjective(BaseObjective):
             groupbys=self.groupbys,
             target_columns=self.target_columns,
             weights=[],
-            pd_score_columns=[pd_column for i in enumerate(range(len(self.evaluator_flags)))]
+            pd_score_columns=[
+                pd_column for i in enumerate(range(len(self.evaluator_flags)))
+            ],
+            max_workers=self.evaluator_threads,
         )
 
         return targets
@@ -37,6 +37,7 @@ def optimize_run(
     Args:
         multiple_objective (MultipleObjective): The multiple objective instance to be optimized.
         n_trials (int): Total number of trials for optimization, distributed across cores.
+                        Workers are capped at `n_trials` and the remainder is spread over the first workers.
         parallel (Union[bool, int]): If True, use all available cores. If False, don't use parallelism.
                                     If int, use the specified number of cores.
 
@@ -51,10 +52,12 @@ def optimize_run(
         n_cores = (
             get_logical_processors_count() if isinstance(parallel, bool) else parallel
         )
-        unit_n_trials = n_trials // n_cores
+        n_cores = max(1, min(n_cores, n_trials))
+        unit_n_trials, extra_n_trials = divmod(n_trials, n_cores)
 
         Parallel(n_jobs=n_cores)(
-            delayed(parallel_optimize)(ob, i, unit_n_trials) for i in range(n_cores)
+            delayed(parallel_optimize)(ob, i, unit_n_trials + (i < extra_n_trials))
+            for i in range(n_cores)
         )
     ob.best_params = np.asarray(list(ob.study.best_params.values()))
     save_study(ob)
@@ -1,9 +1,72 @@
 import csv
 import pickle
+import re
 import sys
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from .multiple_objective import MultipleObjective
 
+_RESULT_PATTERN = re.compile(r"Trial (\d+) finished with result:(.*)")
+_BEST_PATTERN = re.compile(r"Best is trial (\d+)")
+
+
+def _parse_values(line: str, key: str) -> List[str]:
+    """Splits the bracketed list that follows `key` in a log line."""
+    values = line.split(key)[1].strip().strip("[]")
+    return [val.strip() for val in values.split(",") if val.strip()]
+
+
+def _iter_best_trials(file: Iterable[str]) -> Iterator[Tuple[float, int, List, List]]:
+    """
+    Yields (result, trial number, targets, weights) for every best trial in a log.
+
+    The log is read in a single forward pass: the result, targets and weights of
+    every finished trial are remembered, and a trial is yielded the first time it
+    is reported as the best one.
+    """
+    records: Dict[int, List] = {}
+    awaiting_targets: List[int] = []
+    awaiting_weights: List[int] = []
+    best_trials = set()
+    for idx, line in enumerate(file):
+        result_match = _RESULT_PATTERN.search(line)
+        if result_match is not None:
+            trial_number = int(result_match.group(1))
+            records[trial_number] = [result_match.group(2).strip(), None, None]
+            awaiting_targets.append(trial_number)
+        elif "targets:" in line and awaiting_targets:
+            for trial_number in awaiting_targets:
+                records[trial_number][1] = _parse_values(line, "targets:")
+            awaiting_weights.extend(awaiting_targets)
+            awaiting_targets = []
+        elif "weights:" in line and awaiting_weights:
+            for trial_number in awaiting_weights:
+                records[trial_number][2] = _parse_values(line, "weights:")
+            awaiting_weights = []
+
+        best_match = _BEST_PATTERN.search(line)
+        if best_match is None:
+            continue
+        trial_number = int(best_match.group(1))
+        if trial_number in best_trials:
+            continue
+        best_trials.add(trial_number)
+
+        record = records.get(trial_number)
+        if record is None or record[2] is None:
+            continue
+        try:
+            results = float(record[0])
+            targets = [float(val) for val in record[1]]
+            weights = [float(val) for val in record[2]]
+        except ValueError as e:
+            sys.stdout.write(f"Error processing line: {idx}, error: {e}\n")
+            continue
+        sys.stdout.write(f"\ntrail {trial_number}:\t{results}\n")
+        sys.stdout.write(f"sub-target:\t{targets}\n")
+        sys.stdout.write(f"parameters:\t{weights}\n")
+        yield results, trial_number, targets, weights
+
 
 def get_best_trials(multiple_objective: MultipleObjective) -> None:
     """
@@ -13,63 +76,12 @@ def get_best_trials(multiple_objective: MultipleObjective) -> None:
     file_path = f"{ob.full_path}/paradance.log"
     output_path = f"{ob.full_path}/paradance_best_trials.csv"
 
-    with open(file_path, "r") as file:
-        lines = file.readlines()
-
-    best_trials = set()
-    extracted_data = []
     sys.stdout.write(f"\nFormula:\t{ob.formula}\n")
     sys.stdout.write(f"Evaluators:\t{ob.evaluator_flags}\n")
     sys.stdout.write(f"Features:\t{ob.calculator.selected_columns}\n")
-    for idx, line in enumerate(lines):
-        if "Best is trial" in line:
-            trial_number = int(line.split("Best is trial")[1].split(" ")[1])
-
-            if trial_number in best_trials:
-                continue
-
-            best_trials.add(trial_number)
-
-            for sub_idx in range(idx, -1, -1):
-                if f"Trial {trial_number} finished with result:" in lines[sub_idx]:
-                    results_line = lines[sub_idx]
-                    sub_idx += 1
-
-                    while "targets:" not in lines[sub_idx]:
-                        sub_idx += 1
-                    targets_line = (
-                        lines[sub_idx].split("targets:")[1].strip().strip("[]")
-                    )
-
-                    while "weights:" not in lines[sub_idx]:
-                        sub_idx += 1
-                    weights_line = (
-                        lines[sub_idx].split("weights:")[1].strip().strip("[]")
-                    )
-
-                    results = float(results_line.split("result:")[1].strip())
-                    targets_str = [
-                        val.strip() for val in targets_line.split(",") if val.strip()
-                    ]
-                    weights_str = [
-                        val.strip() for val in weights_line.split(",") if val.strip()
-                    ]
-
-                    try:
-                        targets = [float(val) for val in targets_str]
-                        weights = [float(val) for val in weights_str]
-                        sys.stdout.write(f"\ntrail {trial_number}:\t{results}\n")
-                        sys.stdout.write(f"sub-target:\t{targets}\n")
-                        sys.stdout.write(f"parameters:\t{weights}\n")
-                        extracted_data.append((results, trial_number, targets, weights))
-                    except ValueError as e:
-                        sys.stdout.write(
-                            f"Error processing line: {sub_idx}, error: {e}\n"
-                        )
-                    break
-
-    with open(output_path, "w", newline="") as csvfile:
-        writer = csv.writer(csvfile)
+
+    with open(file_path, "r") as file, open(output_path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\n")
         writer.writerow(
             [
                 f"{ob.formula}",
@@ -78,8 +90,10 @@ def get_best_trials(multiple_objective: MultipleObjective) -> None:
                 f"{ob.calculator.selected_columns}",
             ]
         )
-        for data in extracted_data:
-            writer.writerow([data[0], data[1], str(data[2]), str(data[3])])
+        writer.writerows(
+            (results, trial_number, str(targets), str(weights))
+            for results, trial_number, targets, weights in _iter_best_trials(file)
+        )
 
 
 def save_multiple_objective_info(ob: MultipleObjective, filename: str) -> None:
@@ -126,5 +140,5 @@ def save_study(multiple_objective: MultipleObjective) -> None:
     save_multiple_objective_info(ob, f"{ob.full_path}/objective_info.txt")
     ob.study.trials_dataframe().to_csv(f"{ob.full_path}/paradance_full_trials.csv")
     with open(f"{ob.full_path}/study.pkl", "wb") as f:
-        pickle.dump(ob.study, f)
+        pickle.dump(ob.study, f, protocol=pickle.HIGHEST_PROTOCOL)
     get_best_trials(ob)
@@ -1,11 +1,14 @@
+import hashlib
+import json
 import logging
+import os
+import tempfile
 from abc import ABCMeta, abstractmethod
-from itertools import zip_longest
 from typing import Dict, Optional, Union
 
 import pandas as pd
 
-from ..dataloader import CSVLoader, ExcelLoader, load_config
+from ..dataloader import BaseDataLoader, CSVLoader, ExcelLoader, load_config
 from ..evaluation import Calculator, LogarithmPCACalculator
 from ..optimization import MultipleObjective, optimize_run
 
@@ -27,6 +30,7 @@ class BasePipeline(metaclass=ABCMeta):
     Attributes:
         config (Dict): Configuration settings loaded from a configuration file.
         n_trials (int): The number of optimization trials to perform.
+        n_rows (Optional[int]): The number of rows in the dataset, set by `_load_dataset`.
 
     """
 
@@ -39,31 +43,135 @@ class BasePipeline(metaclass=ABCMeta):
         self.dataframe = dataframe
         self.config: Dict = load_config(config_path)
         self.n_trials = n_trials
+        self.n_rows: Optional[int] = None
 
     def _load_dataset(self) -> None:
         """Loads the dataset based on the file type specified in the configuration.
 
-        Supports loading from CSV and Excel files.
+        Supports loading from CSV and Excel files. When `cache` is enabled in the
+        DataLoader config, the loaded frame is stored as Parquet in `cache_dir`
+        (the system temp directory by default) and reused by later runs. With
+        `downcast` enabled, numeric columns are narrowed to float32 and the smallest
+        integer types to reduce memory. With `project_columns` enabled, only the
+        columns named in the Calculator, Evaluator and cleaning settings are read
+        from CSV files.
         """
         if self.dataframe is None:
-            self.file_type = self.config["DataLoader"].get("file_type", "csv")
-            selected_columns = self.config["Calculator"].get("selected_columns", None)
             config = self.config["DataLoader"]
+            self.file_type = config.get("file_type", "csv")
+            selected_columns = self.config["Calculator"].get("selected_columns", None)
             # config["clean_zero_columns"] = selected_columns
-            config["clean_zero_columns"] = self.config["DataLoader"].get("clean_zero_columns", None)
-            config["clean_gauc_lab_columns"] = self.config["DataLoader"].get("clean_gauc_lab_columns", None)
+            config["clean_zero_columns"] = config.get("clean_zero_columns", None)
+            config["clean_gauc_lab_columns"] = config.get(
+                "clean_gauc_lab_columns", None
+            )
+            if config.get("project_columns", False):
+                config["usecols"] = self._needed_columns(config, selected_columns)
             logger.info(f"_load_dataset config {config}")
+            cache_file = (
+                self._dataset_cache_file(config, selected_columns)
+                if config.get("cache", False)
+                else None
+            )
+            if cache_file is not None and os.path.exists(cache_file):
+                logger.info(f"_load_dataset from cache {cache_file}")
+                try:
+                    self.dataframe = pd.read_parquet(cache_file)
+                except (ImportError, OSError, TypeError, ValueError) as e:
+                    logger.warning(f"_load_dataset could not read cache: {e}")
             if self.dataframe is None:
+                loader: Optional[BaseDataLoader] = None
                 if self.file_type == "csv":
                     logger.info(f"_load_dataset csv config {config}")
-                    self.dataframe = CSVLoader(
+                    loader = CSVLoader(
                         config=config,
-                    ).df
+                    )
                 elif self.file_type == "xlsx":
-                    self.dataframe = ExcelLoader(
+                    loader = ExcelLoader(
                         config=config,
-                    ).df
-            logger.info(f"_load_dataset data size {len(self.dataframe)}")
+                    )
+                if loader is not None:
+                    self.dataframe = loader.df
+                    self.n_rows = loader.n_rows
+                if cache_file is not None and self.dataframe is not None:
+                    self._write_dataset_cache(self.dataframe, cache_file)
+            if config.get("downcast", False) and self.dataframe is not None:
+                self.dataframe = BaseDataLoader.downcast_numeric_columns(self.dataframe)
+        if self.n_rows is None and self.dataframe is not None:
+            self.n_rows = len(self.dataframe)
+        logger.info(f"_load_dataset data size {self.n_rows}")
+
+    def _needed_columns(self, config: Dict, selected_columns: Optional[list]) -> list:
+        """Returns the columns the calculator, evaluators and row cleaning refer to."""
+        ev = self.config["Evaluator"]
+        needed = set(selected_columns or [])
+        for key in ("target_columns", "mask_columns", "groupbys"):
+            needed.update(column for column in ev.get(key, ()) if column)
+        clean_zero_columns = config.get("clean_zero_columns")
+        if isinstance(clean_zero_columns, list):
+            needed.update(clean_zero_columns)
+        clean_gauc_lab_columns = config.get("clean_gauc_lab_columns")
+        if isinstance(clean_gauc_lab_columns, dict):
+            needed.update(clean_gauc_lab_columns.keys())
+            needed.update(clean_gauc_lab_columns.values())
+        return sorted(needed)
+
+    @staticmethod
+    def _write_dataset_cache(dataframe: pd.DataFrame, cache_file: str) -> None:
+        """Writes the dataset cache through a temporary file in the same directory.
+
+        The file is moved into place only once it is complete, so concurrent runs
+        never read a partial cache. Frames that cannot be stored as Parquet are
+        logged and left uncached.
+        """
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(cache_file), suffix=".parquet.tmp"
+        )
+        os.close(fd)
+        try:
+            dataframe.to_parquet(tmp_file, compression="zstd")
+            os.replace(tmp_file, cache_file)
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            logger.warning(f"_load_dataset could not write cache: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def _dataset_cache_file(
+        self, config: Dict, selected_columns: Optional[list]
+    ) -> Optional[str]:
+        """Returns the Parquet cache file for the configured dataset.
+
+        The key covers the source path, its modification time and the loader and
+        calculator settings, so editing the file or the config invalidates it.
+        """
+        file_path = str(config.get("file_path"))
+        file_name = config.get("file_name")
+        if file_name is not None:
+            sources = [os.path.join(file_path, f"{file_name}.{self.file_type}")]
+        else:
+            sources = [
+                os.path.join(file_path, file)
+                for file in sorted(os.listdir(file_path))
+                if file.endswith(str(self.file_type))
+            ]
+        try:
+            mtimes = [os.path.getmtime(source) for source in sources]
+        except OSError:
+            return None
+        settings = json.dumps(
+            {
+                key: value
+                for key, value in config.items()
+                if key not in ("cache", "cache_dir")
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.sha1(
+            f"{sources}|{mtimes}|{selected_columns}|{settings}".encode()
+        ).hexdigest()[:16]
+        cache_dir = config.get("cache_dir", tempfile.gettempdir())
+        return os.path.join(cache_dir, f"paradance_{key}.parquet")
 
     @abstractmethod
     def _load_calculator(self) -> Union[Calculator, LogarithmPCACalculator]:
@@ -85,35 +193,15 @@ class BasePipeline(metaclass=ABCMeta):
 
     def _add_evaluators(self) -> None:
         """Adds evaluators for optimization based on configuration settings."""
-        flags = self.config["Evaluator"].get("flags", None)
-        target_columns = self.config["Evaluator"].get("target_columns", [])
-        mask_columns = self.config["Evaluator"].get("mask_columns", [])
-        hyperparameters = self.config["Evaluator"].get("hyperparameters", [])
-        evaluator_propertys = self.config["Evaluator"].get("evaluator_propertys", [])
-        groupbys = self.config["Evaluator"].get("groupbys", [])
-        for (
-            flag,
-            target_column,
-            mask_column,
-            hyperparameter,
-            evaluator_property,
-            groupby,
-        ) in zip_longest(
-            flags,
-            target_columns,
-            mask_columns,
-            hyperparameters,
-            evaluator_propertys,
-            groupbys,
-        ):
-            self.objective.add_evaluator(
-                flag=flag,
-                target_column=target_column,
-                mask_column=mask_column,
-                hyperparameter=hyperparameter,
-                evaluator_property=evaluator_property,
-                groupby=groupby,
-            )
+        ev = self.config["Evaluator"]
+        self.objective.add_evaluators(
+            flags=ev.get("flags", ()),
+            target_columns=ev.get("target_columns", ()),
+            mask_columns=ev.get("mask_columns", ()),
+            hyperparameters=ev.get("hyperparameters", ()),
+            evaluator_propertys=ev.get("evaluator_propertys", ()),
+            groupbys=ev.get("groupbys", ()),
+        )
 
     def _optimize(self) -> None:
         """Runs the optimization process for the defined objective and evaluators."""
@@ -137,7 +225,7 @@ class BasePipeline(metaclass=ABCMeta):
         """
         logger.info("Running pipeline...")
         self._load_dataset()
-        logger.info(f"dataset size {len(self.dataframe)}")
+        logger.info(f"dataset size {self.n_rows}")
         calculator = self._load_calculator()
         self._add_objective(calculator)
         self._add_evaluators()